@@ -40,158 +40,300 @@ import os
 import platform
 import webbrowser
 import struct
+import functools
 
 
 # =============================================================================
 # PURE PYTHON EXIF GPS EXTRACTION (No external dependencies)
 # =============================================================================
 
-def read_jpeg_exif_gps(filepath):
+# Bytes read up front; the EXIF APP1 segment nearly always lies within this
+JPEG_HEAD_SIZE = 65536
+
+# Precompiled struct formats, so format strings aren't parsed on every read
+_U16_LE = struct.Struct('<H')
+_U16_BE = struct.Struct('>H')
+_U32_LE = struct.Struct('<I')
+_U32_BE = struct.Struct('>I')
+_IFD_ENTRY_LE = struct.Struct('<HHI4s')  # tag, type, count, value/offset
+_IFD_ENTRY_BE = struct.Struct('>HHI4s')
+_GPS_TRIPLE_LE = struct.Struct('<IIIIII')  # 3 rationals: degrees, minutes, seconds
+_GPS_TRIPLE_BE = struct.Struct('>IIIIII')
+_MARKER = struct.Struct('>HH')  # JPEG marker code, segment length
+
+# (u16, u32, ifd_entry, gps_triple) per TIFF byte order
+_LE_STRUCTS = (_U16_LE, _U32_LE, _IFD_ENTRY_LE, _GPS_TRIPLE_LE)
+_BE_STRUCTS = (_U16_BE, _U32_BE, _IFD_ENTRY_BE, _GPS_TRIPLE_BE)
+
+# JPEG marker codes
+_MARKER_APP1 = 0xFFE1
+_STANDALONE_MARKERS = frozenset([0xFF01] + list(range(0xFFD0, 0xFFD8)))  # TEM, RST0-7: no length
+_END_MARKERS = frozenset([0xFFDA, 0xFFD9])  # SOS, EOI: no EXIF after these
+
+# Size in bytes of each EXIF value type
+_EXIF_TYPE_SIZES = {1: 1, 2: 1, 3: 2, 4: 4, 5: 8, 7: 1, 9: 4, 10: 8}
+
+
+def open_sequential(filepath):
     """
-    Read GPS coordinates from JPEG EXIF data using pure Python.
-    Returns (latitude, longitude) as floats, or None if not found.
+    Open a file for binary reading, hinting the OS that it is read front to back.
+    Uses FILE_FLAG_SEQUENTIAL_SCAN on Windows, posix_fadvise on Linux.
     """
+    flags = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_SEQUENTIAL', 0)
+    fd = os.open(filepath, flags)
     try:
-        with open(filepath, 'rb') as f:
-            # Check JPEG magic bytes
-            if f.read(2) != b'\xff\xd8':
-                return None
-            
-            # Find EXIF APP1 marker
-            while True:
-                marker = f.read(2)
-                if len(marker) < 2:
-                    return None
-                
-                if marker == b'\xff\xe1':  # APP1 (EXIF)
-                    break
-                elif marker[0:1] == b'\xff':
-                    # Skip other markers
-                    length = struct.unpack('>H', f.read(2))[0]
-                    f.seek(length - 2, 1)
-                else:
+        f = os.fdopen(fd, 'rb')
+    except BaseException:
+        os.close(fd)
+        raise
+    
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # Only a hint, not supported on every filesystem
+    
+    return f
+
+
+def _is_segment_start(buf, pos):
+    """Check that pos is reached by hopping segment lengths from just after SOI."""
+    p = 2
+    while p < pos and p + 4 <= len(buf):
+        p += 2 + _U16_BE.unpack_from(buf, p + 2)[0]
+    return p == pos
+
+
+def _read_exif_segment(f):
+    """
+    Find the EXIF APP1 segment of an open JPEG file.
+    Returns (buf, pos, length) with the whole segment in buf, or None.
+    """
+    # Read the head of the file once and parse it from memory
+    buf = f.read(JPEG_HEAD_SIZE)
+    
+    # Check JPEG magic bytes
+    if buf[0:2] != b'\xff\xd8':
+        return None
+    
+    buf_start = 0  # File offset of buf[0]
+    
+    # Fast path: EXIF is normally the first APPn segment, so search the header
+    # area (up to SOS) for the APP1 marker in one go. Marker bytes may also occur
+    # inside segment data, e.g. an embedded thumbnail with its own EXIF, so a hit
+    # only counts if it has the Exif header and starts a real segment.
+    pos = -1
+    if buf[2:3] == b'\xff' and 0xe0 <= buf[3] <= 0xef:
+        end = buf.find(b'\xff\xda', 2)
+        if end == -1:
+            end = len(buf)
+        pos = buf.find(b'\xff\xe1', 2, end)
+        while pos != -1 and not (buf[pos+4:pos+10] == b'Exif\x00\x00'
+                                 and _is_segment_start(buf, pos)):
+            pos = buf.find(b'\xff\xe1', pos + 2, end)
+    
+    if pos != -1:
+        length = _U16_BE.unpack_from(buf, pos + 2)[0]
+    else:
+        # Find EXIF APP1 marker
+        pos = 2
+        while True:
+            if pos + 4 > len(buf):
+                # Marker lies past the buffered head, read the next chunk
+                buf_start += pos
+                f.seek(buf_start)
+                buf = f.read(JPEG_HEAD_SIZE)
+                pos = 0
+                if len(buf) < 4:
                     return None
             
-            # Read APP1 length and EXIF header
-            length = struct.unpack('>H', f.read(2))[0]
-            exif_header = f.read(6)
+            code, length = _MARKER.unpack_from(buf, pos)
             
-            if exif_header != b'Exif\x00\x00':
+            if code == _MARKER_APP1:  # APP1 (EXIF)
+                break
+            elif (code & 0xFF00) != 0xFF00 or code in _END_MARKERS:
                 return None
-            
-            # TIFF header starts here
-            tiff_start = f.tell()
-            tiff_header = f.read(8)
-            
-            # Determine byte order
-            if tiff_header[0:2] == b'II':
-                endian = '<'  # Little endian
-            elif tiff_header[0:2] == b'MM':
-                endian = '>'  # Big endian
+            elif code in _STANDALONE_MARKERS:
+                pos += 2
             else:
-                return None
-            
-            # Get offset to first IFD
-            ifd_offset = struct.unpack(endian + 'I', tiff_header[4:8])[0]
-            
-            # Helper function to read values
-            def read_ifd_entries(offset):
-                f.seek(tiff_start + offset)
-                num_entries = struct.unpack(endian + 'H', f.read(2))[0]
-                entries = {}
-                
-                for _ in range(num_entries):
-                    tag = struct.unpack(endian + 'H', f.read(2))[0]
-                    type_id = struct.unpack(endian + 'H', f.read(2))[0]
-                    count = struct.unpack(endian + 'I', f.read(4))[0]
-                    value_offset = f.read(4)
-                    
-                    entries[tag] = (type_id, count, value_offset)
-                
-                return entries
-            
-            def get_value(type_id, count, value_offset):
-                """Get actual value from IFD entry."""
-                type_sizes = {1: 1, 2: 1, 3: 2, 4: 4, 5: 8, 7: 1, 9: 4, 10: 8}
-                size = type_sizes.get(type_id, 1) * count
-                
-                if size <= 4:
-                    data = value_offset
-                else:
-                    offset = struct.unpack(endian + 'I', value_offset)[0]
-                    pos = f.tell()
-                    f.seek(tiff_start + offset)
-                    data = f.read(size)
-                    f.seek(pos)
-                
-                return data
-            
-            def read_rational(data, offset=0):
-                """Read a rational (fraction) value."""
-                if isinstance(data, bytes):
-                    num = struct.unpack(endian + 'I', data[offset:offset+4])[0]
-                    den = struct.unpack(endian + 'I', data[offset+4:offset+8])[0]
-                else:
-                    return 0
-                return num / den if den != 0 else 0
-            
-            def read_gps_coord(data):
-                """Read GPS coordinate (3 rationals: degrees, minutes, seconds)."""
-                degrees = read_rational(data, 0)
-                minutes = read_rational(data, 8)
-                seconds = read_rational(data, 16)
-                return degrees + minutes / 60 + seconds / 3600
-            
-            # Read IFD0
-            ifd0 = read_ifd_entries(ifd_offset)
-            
-            # Find GPS IFD pointer (tag 0x8825)
-            if 0x8825 not in ifd0:
-                return None
-            
-            gps_offset = struct.unpack(endian + 'I', ifd0[0x8825][2])[0]
-            
-            # Read GPS IFD
-            gps_ifd = read_ifd_entries(gps_offset)
-            
-            # GPS tags we need:
-            # 0x0001 = GPSLatitudeRef (N/S)
-            # 0x0002 = GPSLatitude
-            # 0x0003 = GPSLongitudeRef (E/W)
-            # 0x0004 = GPSLongitude
-            
-            if 0x0002 not in gps_ifd or 0x0004 not in gps_ifd:
-                return None
-            
-            # Read latitude
-            lat_data = get_value(*gps_ifd[0x0002])
-            latitude = read_gps_coord(lat_data)
-            
-            # Read latitude reference
-            if 0x0001 in gps_ifd:
-                lat_ref = get_value(*gps_ifd[0x0001])
-                if isinstance(lat_ref, bytes) and lat_ref[0:1] in (b'S', b's'):
-                    latitude = -latitude
-            
-            # Read longitude
-            lon_data = get_value(*gps_ifd[0x0004])
-            longitude = read_gps_coord(lon_data)
-            
-            # Read longitude reference
-            if 0x0003 in gps_ifd:
-                lon_ref = get_value(*gps_ifd[0x0003])
-                if isinstance(lon_ref, bytes) and lon_ref[0:1] in (b'W', b'w'):
-                    longitude = -longitude
-            
-            return (latitude, longitude)
+                # Skip other markers
+                pos += 2 + length
+    
+    # All EXIF offsets stay within the APP1 segment, so make sure
+    # the whole segment is in memory
+    if pos + 2 + length > len(buf):
+        f.seek(buf_start + pos)
+        buf = f.read(2 + length)
+        pos = 0
+    
+    return buf, pos, length
+
+
+def _ifd_table(buf, ifd_start, end, structs):
+    """
+    Slice the entry table of an IFD, clamped to the segment end and trimmed
+    to whole 12-byte entries. Returns (num_entries, table).
+    """
+    if ifd_start + 2 > end:
+        return 0, b''
+    num_entries = structs[0].unpack_from(buf, ifd_start)[0]
+    table = buf[ifd_start+2:min(ifd_start + 2 + num_entries * 12, end)]
+    return num_entries, table[:len(table) - len(table) % 12]
+
+
+def _find_gps_ifd_offset(buf, ifd_start, end, structs):
+    """
+    Scan an IFD for the GPS IFD pointer (tag 0x8825) in one bulk slice,
+    instead of unpacking every entry field by field. Returns the offset or None.
+    """
+    _, u32, ifd_entry, _ = structs
+    _, ifd_data = _ifd_table(buf, ifd_start, end, structs)
     
+    for tag, _, _, value_offset in ifd_entry.iter_unpack(ifd_data):
+        if tag == 0x8825:
+            return u32.unpack(value_offset)[0]
+    
+    return None
+
+
+def _read_ifd_entries(buf, ifd_start, end, structs):
+    """Read all entries of an IFD into a dict of tag -> (type_id, count, value_offset)."""
+    num_entries, raw = _ifd_table(buf, ifd_start, end, structs)
+    if len(raw) != num_entries * 12:
+        return {}  # Truncated IFD
+    
+    return {
+        tag: (type_id, count, value_offset)
+        for tag, type_id, count, value_offset in structs[2].iter_unpack(raw)
+    }
+
+
+def _get_value(buf, tiff_start, end, entry, structs):
+    """Get actual value from IFD entry, never reading past the segment end."""
+    type_id, count, value_offset = entry
+    size = _EXIF_TYPE_SIZES.get(type_id, 1) * count
+    
+    if size <= 4:
+        data = value_offset
+    else:
+        offset = tiff_start + structs[1].unpack(value_offset)[0]
+        data = buf[offset:min(offset + size, end)]
+    
+    return data
+
+
+def _read_gps_coord(data, structs):
+    """Read GPS coordinate (3 rationals: degrees, minutes, seconds)."""
+    n1, d1, n2, d2, n3, d3 = structs[3].unpack_from(data, 0)
+    degrees = n1 / d1 if d1 else 0
+    minutes = n2 / d2 if d2 else 0
+    seconds = n3 / d3 if d3 else 0
+    return degrees + minutes / 60 + seconds / 3600
+
+
+def read_jpeg_exif_gps(filepath):
+    """
+    Read GPS coordinates from JPEG EXIF data using pure Python.
+    Returns (latitude, longitude) as floats, or None if not found.
+    Raises OSError if the file can't be read, e.g. while GIMP is saving it.
+    """
+    try:
+        with open_sequential(filepath) as f:
+            segment = _read_exif_segment(f)
+        
+        if segment is None:
+            return None
+        
+        buf, pos, length = segment
+        segment_end = pos + 2 + length
+        
+        # Check EXIF header
+        if buf[pos+4:pos+10] != b'Exif\x00\x00':
+            return None
+        
+        # TIFF header starts here
+        tiff_start = pos + 10
+        tiff_header = buf[tiff_start:tiff_start+8]
+        
+        # Determine byte order
+        if tiff_header[0:2] == b'II':  # Little endian
+            structs = _LE_STRUCTS
+        elif tiff_header[0:2] == b'MM':  # Big endian
+            structs = _BE_STRUCTS
+        else:
+            return None
+        
+        # Get offset to first IFD
+        ifd_offset = structs[1].unpack_from(tiff_header, 4)[0]
+        
+        # Find GPS IFD pointer in IFD0
+        gps_offset = _find_gps_ifd_offset(buf, tiff_start + ifd_offset, segment_end, structs)
+        if gps_offset is None:
+            return None
+        
+        # Read GPS IFD
+        gps_ifd = _read_ifd_entries(buf, tiff_start + gps_offset, segment_end, structs)
+        
+        # GPS tags we need:
+        # 0x0001 = GPSLatitudeRef (N/S)
+        # 0x0002 = GPSLatitude
+        # 0x0003 = GPSLongitudeRef (E/W)
+        # 0x0004 = GPSLongitude
+        
+        if 0x0002 not in gps_ifd or 0x0004 not in gps_ifd:
+            return None
+        
+        # Read latitude
+        lat_data = _get_value(buf, tiff_start, segment_end, gps_ifd[0x0002], structs)
+        latitude = _read_gps_coord(lat_data, structs)
+        
+        # Read latitude reference
+        if 0x0001 in gps_ifd:
+            lat_ref = _get_value(buf, tiff_start, segment_end, gps_ifd[0x0001], structs)
+            if isinstance(lat_ref, bytes) and lat_ref[0:1] in (b'S', b's'):
+                latitude = -latitude
+        
+        # Read longitude
+        lon_data = _get_value(buf, tiff_start, segment_end, gps_ifd[0x0004], structs)
+        longitude = _read_gps_coord(lon_data, structs)
+        
+        # Read longitude reference
+        if 0x0003 in gps_ifd:
+            lon_ref = _get_value(buf, tiff_start, segment_end, gps_ifd[0x0003], structs)
+            if isinstance(lon_ref, bytes) and lon_ref[0:1] in (b'W', b'w'):
+                longitude = -longitude
+        
+        return (latitude, longitude)
+    
+    except OSError:
+        raise  # Not a parse result, so callers mustn't cache it as "no GPS"
     except Exception as e:
         print(f"Error reading EXIF GPS: {e}")
         return None
 
 
+# Whether a file has GPS data: filepath -> (mtime_ns, has_gps). Filled in by
+# get_gps_coordinates, so the Google Maps operator's poll can grey out the menu
+# entry without parsing EXIF
+_gps_presence = {}
+
+
 def get_gps_coordinates(filepath):
-    """Get GPS coordinates from an image file. Returns (lat, lon) or None."""
+    """
+    Get GPS coordinates from an image file. Returns (lat, lon) or None.
+    Raises OSError if the file can't be read; such failures are neither cached nor recorded.
+    """
+    # Key the cache on the modification time, so an image re-saved
+    # from GIMP is parsed again instead of returning stale coordinates
+    mtime_ns = os.stat(filepath).st_mtime_ns
+    coords = _get_gps_coordinates_cached(filepath, mtime_ns)
+    _gps_presence[filepath] = (mtime_ns, coords is not None)
+    return coords
+
+
+@functools.lru_cache(maxsize=512)
+def _get_gps_coordinates_cached(filepath, mtime_ns):
+    """Parse GPS coordinates once per (filepath, mtime) pair. Raises OSError on read errors."""
     # Check file extension
     ext = os.path.splitext(filepath)[1].lower()
     
@@ -203,11 +345,52 @@ def get_gps_coordinates(filepath):
     return None
 
 
+def is_known_without_gps(filepath):
+    """
+    Return True if an earlier read found no GPS data in this version of the file.
+    Only stats the file when there is such an entry, as poll calls this on every redraw.
+    """
+    entry = _gps_presence.get(filepath)
+    if entry is None or entry[1]:
+        return False
+    
+    try:
+        return os.stat(filepath).st_mtime_ns == entry[0]
+    except OSError:
+        return False
+
+
 # =============================================================================
 # GIMP PATH DETECTION
 # =============================================================================
 
+# Auto-detected GIMP path, looked up once and reset when the preference changes
+_cached_gimp_path = None
+
+
 def get_default_gimp_path():
+    """Return the auto-detected GIMP path, probing the filesystem only once."""
+    global _cached_gimp_path
+    if _cached_gimp_path is None:
+        _cached_gimp_path = detect_gimp_path()
+    return _cached_gimp_path
+
+
+def reset_gimp_path_cache(self=None, context=None):
+    """Forget the auto-detected GIMP path (also used as preference update callback)."""
+    global _cached_gimp_path
+    _cached_gimp_path = None
+
+
+def find_first_existing(paths):
+    """Return the first path in paths that exists, or None."""
+    for path in paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def detect_gimp_path():
     """Try to find GIMP installation path based on OS."""
     system = platform.system()
     
@@ -219,20 +402,14 @@ def get_default_gimp_path():
             r"C:\Program Files (x86)\GIMP 2\bin\gimp-2.10.exe",
             os.path.expandvars(r"%LOCALAPPDATA%\Programs\GIMP 2\bin\gimp-2.10.exe"),
         ]
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-        return "gimp"
+        return find_first_existing(possible_paths) or "gimp"
     
     elif system == "Darwin":  # macOS
         possible_paths = [
             "/Applications/GIMP.app/Contents/MacOS/gimp",
             "/Applications/GIMP-2.10.app/Contents/MacOS/gimp",
         ]
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-        return "gimp"
+        return find_first_existing(possible_paths) or "gimp"
     
     else:  # Linux
         return "gimp"
@@ -242,21 +419,42 @@ def get_default_gimp_path():
 # HELPER FUNCTION TO GET FILE PATH FROM STRIP
 # =============================================================================
 
+# Resolved strip directories, keyed on strip.as_pointer():
+# (raw directory, blend file path, absolute directory)
+_dir_cache = {}
+
+
+def get_strip_directory(strip):
+    """Get the absolute directory of an image strip, resolved once per strip."""
+    key = strip.as_pointer()
+    raw_directory = strip.directory
+    blend_path = bpy.data.filepath  # Relative '//' paths depend on it
+    
+    cached = _dir_cache.get(key)
+    if cached is not None and cached[0] == raw_directory and cached[1] == blend_path:
+        return cached[2]
+    
+    directory = bpy.path.abspath(raw_directory)
+    _dir_cache[key] = (raw_directory, blend_path, directory)
+    return directory
+
+
 def get_strip_filepath(strip, context):
     """Get the file path from an image or movie strip."""
     if strip.type == 'IMAGE':
-        directory = bpy.path.abspath(strip.directory)
-        if strip.elements:
+        directory = get_strip_directory(strip)
+        elements = strip.elements
+        if elements:
             # For single-image strips, just get the first element
-            if len(strip.elements) == 1:
-                filename = strip.elements[0].filename
+            if len(elements) == 1:
+                filename = elements[0].filename
             else:
                 # For multi-image strips, get current frame's image
                 current_frame = context.scene.frame_current
                 strip_start = strip.frame_final_start
                 element_index = current_frame - strip_start
-                element_index = max(0, min(element_index, len(strip.elements) - 1))
-                filename = strip.elements[element_index].filename
+                element_index = max(0, min(element_index, len(elements) - 1))
+                filename = elements[element_index].filename
             return os.path.join(directory, filename)
     
     elif strip.type == 'MOVIE':
@@ -276,7 +474,8 @@ class VSEToolsPreferences(bpy.types.AddonPreferences):
         name="GIMP Executable Path",
         description="Path to GIMP executable. Leave empty for auto-detect",
         default="",
-        subtype='FILE_PATH'
+        subtype='FILE_PATH',
+        update=reset_gimp_path_cache
     )
     
     def draw(self, context):
@@ -357,7 +556,7 @@ class SEQUENCER_OT_open_source_folder(bpy.types.Operator):
         strip = context.scene.sequence_editor.active_strip
         
         if strip.type == 'IMAGE':
-            directory = bpy.path.abspath(strip.directory)
+            directory = get_strip_directory(strip)
         elif strip.type in {'MOVIE', 'SOUND'}:
             directory = os.path.dirname(bpy.path.abspath(strip.filepath))
         else:
@@ -385,8 +584,16 @@ class SEQUENCER_OT_open_source_folder(bpy.types.Operator):
         return {'FINISHED'}
 
 
+# Google Maps search URL for a (latitude, longitude) pair
+GOOGLE_MAPS_URL = "https://www.google.com/maps?q=%.6f,%.6f"
+
+# Most image strips handled in one go, so selecting all strips doesn't
+# parse every photo and open hundreds of browser tabs
+MAX_MAPS_STRIPS = 10
+
+
 class SEQUENCER_OT_show_in_google_maps(bpy.types.Operator):
-    """Open the photo's GPS location in Google Maps (if GPS data exists in JPEG)"""
+    """Open the selected photos' GPS locations in Google Maps (if GPS data exists in JPEG)"""
     bl_idname = "sequencer.show_in_google_maps"
     bl_label = "Show in Google Maps"
     bl_options = {'REGISTER'}
@@ -398,42 +605,81 @@ class SEQUENCER_OT_show_in_google_maps(bpy.types.Operator):
         strip = context.scene.sequence_editor.active_strip
         if strip is None:
             return False
-        return strip.type == 'IMAGE'
+        if strip.type != 'IMAGE':
+            return False
+        
+        # Only disable when an earlier run found no GPS data in this exact file
+        # version and no other image strips are selected (execute handles those
+        # too); poll runs on every redraw, so never parse EXIF here
+        filepath = get_strip_filepath(strip, context)
+        if filepath and is_known_without_gps(filepath):
+            if not any(s.type == 'IMAGE' and s != strip for s in context.selected_strips):
+                cls.poll_message_set("No GPS data found in this image")
+                return False
+        return True
     
     def execute(self, context):
-        strip = context.scene.sequence_editor.active_strip
-        filepath = get_strip_filepath(strip, context)
+        # The active strip, plus any other selected image strips
+        active = context.scene.sequence_editor.active_strip
+        strips = [active] + [
+            strip for strip in context.selected_strips
+            if strip.type == 'IMAGE' and strip != active
+        ]
         
-        if not filepath:
-            self.report({'ERROR'}, "Could not determine file path")
+        if len(strips) > MAX_MAPS_STRIPS:
+            self.report({'WARNING'}, f"{len(strips)} image strips selected, "
+                        f"select at most {MAX_MAPS_STRIPS} to show in Google Maps")
             return {'CANCELLED'}
         
-        if not os.path.exists(filepath):
-            self.report({'ERROR'}, f"File not found: {filepath}")
-            return {'CANCELLED'}
+        # One tab per distinct location; photos taken at the same spot share it
+        urls = []
+        for strip in strips:
+            coords = self.get_strip_gps(strip, context)
+            if coords is not None:
+                url = GOOGLE_MAPS_URL % coords
+                if url not in urls:
+                    urls.append(url)
+                    webbrowser.open_new_tab(url)
+                    last_coords = coords
         
-        # Check if it's a JPEG
-        ext = os.path.splitext(filepath)[1].lower()
-        if ext not in ('.jpg', '.jpeg'):
-            self.report({'WARNING'}, f"GPS reading only supported for JPEG files (this is {ext})")
+        if not urls:
             return {'CANCELLED'}
         
-        # Get GPS coordinates
-        coords = get_gps_coordinates(filepath)
+        if len(urls) == 1:
+            self.report({'INFO'}, "GPS: %.6f, %.6f" % last_coords)
+        else:
+            self.report({'INFO'}, f"Opened {len(urls)} locations in Google Maps")
         
-        if coords is None:
-            self.report({'WARNING'}, f"No GPS data found in: {os.path.basename(filepath)}")
-            return {'CANCELLED'}
+        return {'FINISHED'}
+    
+    def get_strip_gps(self, strip, context):
+        """Get (lat, lon) for a strip, reporting why not and returning None if unavailable."""
+        filepath = get_strip_filepath(strip, context)
         
-        lat, lon = coords
+        if not filepath:
+            self.report({'ERROR'}, "Could not determine file path")
+            return None
         
-        # Open Google Maps
-        url = f"https://www.google.com/maps?q={lat},{lon}"
-        webbrowser.open(url)
+        # Get GPS coordinates. A failed read is reported but not recorded,
+        # so the user can retry
+        try:
+            coords = get_gps_coordinates(filepath)
+        except FileNotFoundError:
+            self.report({'ERROR'}, f"File not found: {filepath}")
+            return None
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not read {os.path.basename(filepath)}: {e}")
+            return None
         
-        self.report({'INFO'}, f"GPS: {lat:.6f}, {lon:.6f}")
+        if coords is None:
+            # Check if it's a JPEG
+            ext = os.path.splitext(filepath)[1].lower()
+            if ext not in ('.jpg', '.jpeg'):
+                self.report({'WARNING'}, f"GPS reading only supported for JPEG files (this is {ext})")
+            else:
+                self.report({'WARNING'}, f"No GPS data found in: {os.path.basename(filepath)}")
         
-        return {'FINISHED'}
+        return coords
 
 
 # =============================================================================
@@ -539,6 +785,11 @@ def unregister():
     
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
+    
+    _dir_cache.clear()
+    _gps_presence.clear()
+    _get_gps_coordinates_cached.cache_clear()
+    reset_gimp_path_cache()
 
 
 if __name__ == "__main__":